@@ -4,8 +4,10 @@ Script to generate a cover letter Word document from a template file, using data
 
 import argparse
 import datetime
+import io
 import json
 import logging
+import re
 from pathlib import Path
 from typing import Dict, Any
 
@@ -13,6 +15,11 @@ from docx import Document
 from docx.shared import Pt, Cm
 from docx.enum.style import WD_STYLE_TYPE
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,22 +27,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def load_template(template_path: Path) -> str:
     """Load the cover letter template from a file."""
     try:
-        with template_path.open("r") as f:
-            return f.read()
+        return template_path.read_text(encoding="utf-8")
     except IOError as e:
-        logger.error(f"Failed to read template from {template_path}: {str(e)}")
+        logger.error("Failed to read template from %s: %s", template_path, e)
         raise
 
 def load_json(json_path: Path) -> Dict[str, Any]:
     """Load JSON data from a file."""
     try:
-        with json_path.open("r") as f:
-            return json.load(f)
+        with json_path.open("rb") as f:
+            return _loads(f.read())
     except (IOError, json.JSONDecodeError) as e:
-        logger.error(f"Failed to load JSON from {json_path}: {str(e)}")
+        logger.error("Failed to load JSON from %s: %s", json_path, e)
         raise
 
 def create_cover_letter(data: Dict[str, str], template: str, output_file: str) -> None:
@@ -57,19 +69,23 @@ def create_cover_letter(data: Dict[str, str], template: str, output_file: str) -
             section.left_margin = Cm(2.54)
             section.right_margin = Cm(2.54)
 
-        # Replace placeholders in template
+        # Replace placeholders in a single pass; longer keys are tried first
+        # so that one placeholder never shadows another sharing its prefix
         letter_content = template
-        for key, value in data.items():
-            placeholder = f"${key}"
-            letter_content = letter_content.replace(placeholder, value)
-
-        # Split content into lines and process
-        lines = letter_content.split('\n')
+        if data:
+            keys = sorted(data, key=len, reverse=True)
+            pattern = re.compile("|".join(re.escape(f"${key}") for key in keys))
+            letter_content = pattern.sub(lambda match: data[match.group(0)[1:]], template)
+
+        # Header lines are spaced tightly rather than as body paragraphs
+        header_lines = frozenset(
+            [data['name'], data['address'], f"{data['phone']} | {data['email']}", data['date']]
+        )
+
+        # Split content into stripped, non-empty lines and process
+        lines = [s for s in (ln.strip() for ln in letter_content.split('\n')) if s]
+        prev = ""
         for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
             # Handle specific sections with custom formatting
             if line == 'Dear Hiring Manager,':
                 para = doc.add_paragraph(line)
@@ -78,24 +94,28 @@ def create_cover_letter(data: Dict[str, str], template: str, output_file: str) -
                 para = doc.add_paragraph(line)
                 para.style = 'Normal'
                 para.space_before = Pt(12)
-            elif line == data['name'] and lines[lines.index(line) - 1].strip() == 'Sincerely,':
+            elif line == data['name'] and prev == 'Sincerely,':
                 para = doc.add_paragraph(line)
                 para.style = 'Normal'
             else:
                 # Assume body paragraphs or header lines
                 para = doc.add_paragraph(line)
                 para.style = 'Normal'
-                if line in [data['name'], data['address'], f"{data['phone']} | {data['email']}", data['date']]:
+                if line in header_lines:
                     para.space_after = Pt(6)
                 else:
                     para.space_before = Pt(12)
                     para.space_after = Pt(12)
 
-        # Save the document
-        doc.save(output_file)
-        logger.info(f"Cover letter saved to {output_file}")
+            prev = line
+
+        # Save the document in memory, then write it out in one call
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        Path(output_file).write_bytes(buffer.getbuffer())
+        logger.info("Cover letter saved to %s", output_file)
     except Exception as e:
-        logger.error(f"Failed to generate cover letter: {str(e)}")
+        logger.error("Failed to generate cover letter: %s", e)
         raise
 
 def main() -> None:
@@ -167,7 +187,7 @@ def main() -> None:
         # Generate cover letter
         create_cover_letter(data, template, output_file)
     except Exception as e:
-        logger.critical(f"Application failed: {str(e)}")
+        logger.critical("Application failed: %s", e)
         exit(1)
 
 if __name__ == "__main__":
@@ -3,12 +3,16 @@ ResumeGen: A tool to convert JSON resumes into formatted Word documents.
 """
 
 import argparse
+import copy
 import datetime
+import io
 import json
 import logging
 import re
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union
 
 import docx
 import requests
@@ -16,6 +20,11 @@ from docx.enum.dml import MSO_THEME_COLOR_INDEX
 from docx.oxml.ns import qn
 from docx.shared import Pt, Cm
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,34 +32,99 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# HTML anchor patterns used when rendering resume text
+_HYPERLINK_FULL = re.compile(r'<a\s+[^>]*href=[\'"](.*?)[\'"][^>]*>(.*?)</a>')
+_HYPERLINK_STRIP = re.compile(r'<a\s+[^>]*>(.*?)</a>')
+
+# Shared HTTP session so repeated fetches reuse pooled connections
+_SESSION = requests.Session()
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@dataclass(frozen=True)
+class ResumeConfig:
+    """Immutable document styling settings (font size in points, margins in cm)."""
+
+    __slots__ = ("font_name", "font_size", "top", "bottom", "left", "right")
+
+    font_name: str
+    font_size: int
+    top: float
+    bottom: float
+    left: float
+    right: float
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "ResumeConfig":
+        """Build a ResumeConfig from the nested {"font": ..., "margins": ...} dictionary."""
+        font = config["font"]
+        margins = config["margins"]
+        return cls(
+            font_name=font["name"],
+            font_size=font["size"],
+            top=margins["top"],
+            bottom=margins["bottom"],
+            left=margins["left"],
+            right=margins["right"],
+        )
+
 class ResumeGen:
     """Class to generate a Word document resume from JSON data."""
     
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Union[ResumeConfig, Dict[str, Any]]) -> None:
         """Initialize ResumeGen with configuration settings."""
+        if not isinstance(config, ResumeConfig):
+            config = ResumeConfig.from_dict(config)
         self.config = config
         self.doc = docx.Document()
         self._apply_document_styles()
+        self._bullet_template = self._build_bullet_template()
+        self._rel_cache: Dict[Tuple[Any, str], str] = {}
 
     def _apply_document_styles(self) -> None:
         """Apply default styles to the document."""
         for style_name in ["Normal", "Heading 1", "Heading 2", "Heading 3"]:
             style = self.doc.styles[style_name]
             font = style.font
-            font.name = self.config["font"]["name"]
-            font.size = Pt(self.config["font"]["size"])
+            font.name = self.config.font_name
+            font.size = Pt(self.config.font_size)
 
         # Configure page margins
         for section in self.doc.sections:
-            section.top_margin = Cm(self.config["margins"]["top"])
-            section.bottom_margin = Cm(self.config["margins"]["bottom"])
-            section.left_margin = Cm(self.config["margins"]["left"])
-            section.right_margin = Cm(self.config["margins"]["right"])
+            section.top_margin = Cm(self.config.top)
+            section.bottom_margin = Cm(self.config.bottom)
+            section.left_margin = Cm(self.config.left)
+            section.right_margin = Cm(self.config.right)
+
+    def _build_bullet_template(self) -> docx.oxml.xmlchemy.BaseOxmlElement:
+        """Build an empty "List Bullet" paragraph element to copy for each bullet."""
+        p_style = docx.oxml.shared.OxmlElement("w:pStyle")
+        p_style.set(qn("w:val"), self.doc.styles["List Bullet"].style_id)
+        p_pr = docx.oxml.shared.OxmlElement("w:pPr")
+        p_pr.append(p_style)
+        p = docx.oxml.shared.OxmlElement("w:p")
+        p.append(p_pr)
+        return p
+
+    def _add_bullet_paragraph(self) -> docx.text.paragraph.Paragraph:
+        """Append a "List Bullet" paragraph without a per-paragraph style lookup."""
+        p = copy.deepcopy(self._bullet_template)
+        self.doc.element.body._insert_p(p)
+        return docx.text.paragraph.Paragraph(p, self.doc._body)
 
     def add_hyperlink(self, paragraph: docx.text.paragraph.Paragraph, text: str, url: str) -> None:
         """Add a hyperlink to a paragraph."""
+        # Reuse the relationship id when the same URL is linked more than once;
+        # rIds are scoped to a part, so the cache is keyed by part as well
         part = paragraph.part
-        r_id = part.relate_to(url, docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+        r_id = self._rel_cache.get((part, url))
+        if r_id is None:
+            r_id = part.relate_to(url, docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+            self._rel_cache[(part, url)] = r_id
         hyperlink = docx.oxml.shared.OxmlElement("w:hyperlink")
         hyperlink.set(qn("r:id"), r_id)
 
@@ -67,23 +141,23 @@ class ResumeGen:
 
     def process_text_with_hyperlinks(self, paragraph: docx.text.paragraph.Paragraph, text: str) -> None:
         """Process text, converting HTML <a> tags to Word hyperlinks."""
-        pattern = r'<a\s+[^>]*href=[\'"](.*?)[\'"][^>]*>(.*?)</a>'
-        last_pos = 0
-        for match in re.finditer(pattern, text):
-            start, end = match.span()
-            # Add text before the hyperlink
-            if start > last_pos:
-                paragraph.add_run(text[last_pos:start])
-            # Add the hyperlink
-            self.add_hyperlink(paragraph, match.group(2), match.group(1))
-            last_pos = end
-        # Add remaining text
-        if last_pos < len(text):
-            paragraph.add_run(text[last_pos:])
+        # Most text has no links; skip the regex scan entirely
+        if "<a" not in text:
+            if text:
+                paragraph.add_run(text)
+            return
+
+        # split() yields [text, url, link_text, text, url, link_text, ..., text]
+        parts = _HYPERLINK_FULL.split(text)
+        for i in range(0, len(parts), 3):
+            if parts[i]:
+                paragraph.add_run(parts[i])
+            if i + 2 < len(parts):
+                self.add_hyperlink(paragraph, parts[i + 2], parts[i + 1])
 
     def remove_hyperlink(self, text: str) -> str:
         """Remove HTML <a> tags from text, keeping the inner content."""
-        return re.sub(r'<a\s+[^>]*>(.*?)</a>', r'\1', text)
+        return _HYPERLINK_STRIP.sub(r'\1', text)
 
     def generate_resume(self, resume_data: Dict[str, Any], output_file: str) -> None:
         """Generate a resume from JSON data and save it as a Word document."""
@@ -107,10 +181,10 @@ class ResumeGen:
             self.doc.add_heading(resume_data["header"]["title"], 3)
 
             # Sort and process content sections
-            contents = sorted(resume_data["contents"], key=lambda x: x["id"], reverse=True)
+            contents = sorted(resume_data["contents"], key=itemgetter("id"), reverse=True)
             for datum in contents:
                 self.doc.add_heading(datum["title"], 1)
-                items = sorted(datum["content"], key=lambda x: x["id"], reverse=True)
+                items = sorted(datum["content"], key=itemgetter("id"), reverse=True)
                 for item in items:
                     if item["position"]:
                         # Strip hyperlinks from position before rendering as heading
@@ -120,33 +194,35 @@ class ResumeGen:
                         self.doc.add_heading(heading, 2)
 
                     for bullet_item in item["items"]:
-                        paragraph = self.doc.add_paragraph(style="List Bullet")
+                        paragraph = self._add_bullet_paragraph()
                         self.process_text_with_hyperlinks(paragraph, bullet_item)
 
-            # Save the document
-            self.doc.save(output_file)
-            logger.info(f"Resume saved to {output_file}")
+            # Save the document in memory, then write it out in one call
+            buffer = io.BytesIO()
+            self.doc.save(buffer)
+            Path(output_file).write_bytes(buffer.getbuffer())
+            logger.info("Resume saved to %s", output_file)
         except Exception as e:
-            logger.error(f"Failed to generate resume: {str(e)}")
+            logger.error("Failed to generate resume: %s", e)
             raise
 
 def fetch_json(url: str, headers: Dict[str, str]) -> Dict[str, Any]:
     """Fetch JSON data from a URL."""
     try:
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=headers, timeout=30)
         response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        logger.error(f"Failed to fetch JSON from {url}: {str(e)}")
+        return _loads(response.content)
+    except (requests.RequestException, json.JSONDecodeError) as e:
+        logger.error("Failed to fetch JSON from %s: %s", url, e)
         raise
 
 def load_json(file_path: Path) -> Dict[str, Any]:
     """Load JSON data from a file."""
     try:
-        with file_path.open("r") as f:
-            return json.load(f)
+        with file_path.open("rb") as f:
+            return _loads(f.read())
     except (IOError, json.JSONDecodeError) as e:
-        logger.error(f"Failed to load JSON from {file_path}: {str(e)}")
+        logger.error("Failed to load JSON from %s: %s", file_path, e)
         raise
 
 def main() -> None:
@@ -207,7 +283,7 @@ def main() -> None:
         generator = ResumeGen(config)
         generator.generate_resume(resume_data, output_file)
     except Exception as e:
-        logger.critical(f"Application failed: {str(e)}")
+        logger.critical("Application failed: %s", e)
         exit(1)
 
 if __name__ == "__main__":
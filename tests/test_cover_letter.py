@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+from types import SimpleNamespace
+import json
+
+from docx.shared import Pt
+
+from cover_letter import create_cover_letter, load_json, load_template
+
+class TestCoverLetter(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.json_data = {
+            "header": {
+                "name": "Nicholas Borbaki",
+                "phone": "555-0100",
+                "email": "nicholas@example.com",
+                "address": "1 Main St, Springfield",
+            }
+        }
+        self.test_file = Path("test_resume.json")
+        self.data = {
+            "name": "Nicholas Borbaki",
+            "address": "1 Main St, Springfield",
+            "phone": "555-0100",
+            "email": "nicholas@example.com",
+            "date": "May 24, 2025",
+            "position": "Principal Software Engineer",
+            "company": "Example Corp",
+        }
+
+    def render(self, data, template):
+        """Render a cover letter and return the paragraphs added to the document."""
+        paragraphs = []
+
+        def add_paragraph(text):
+            para = SimpleNamespace(text=text)
+            paragraphs.append(para)
+            return para
+
+        with patch("cover_letter.Document") as mock_document, \
+             patch("pathlib.Path.write_bytes"):
+            mock_document.return_value.add_paragraph.side_effect = add_paragraph
+            create_cover_letter(data, template, "output.docx")
+        return paragraphs
+
+    def test_load_json_success(self):
+        """Test loading valid JSON from a file."""
+        with patch("pathlib.Path.open", new_callable=MagicMock) as mock_open:
+            mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(self.json_data).encode()
+            result = load_json(self.test_file)
+            self.assertEqual(result, self.json_data)
+            mock_open.assert_called_once_with("rb")
+
+    def test_load_json_without_orjson(self):
+        """Test loading JSON falls back to the stdlib decoder when orjson is unavailable."""
+        with patch("cover_letter.orjson", None), \
+             patch("pathlib.Path.open", new_callable=MagicMock) as mock_open:
+            mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(self.json_data).encode()
+            result = load_json(self.test_file)
+            self.assertEqual(result, self.json_data)
+
+    def test_load_json_invalid_json(self):
+        """Test loading invalid JSON."""
+        with patch("pathlib.Path.open", new_callable=MagicMock) as mock_open, \
+             self.assertLogs("cover_letter", level="ERROR") as log:
+            mock_open.return_value.__enter__.return_value.read.return_value = b"invalid json"
+            with self.assertRaises(json.JSONDecodeError):
+                load_json(self.test_file)
+            self.assertIn("Failed to load JSON from test_resume.json", log.output[0])
+
+    def test_placeholders_sharing_prefix(self):
+        """Test a placeholder is not shadowed by a shorter key sharing its prefix."""
+        data = dict(self.data, company_url="https://example.com")
+        paragraphs = self.render(data, "Apply at $company ($company_url)")
+        self.assertEqual(paragraphs[0].text, "Apply at Example Corp (https://example.com)")
+
+    def test_placeholder_values_are_not_expanded(self):
+        """Test substituted values containing $ are inserted verbatim."""
+        data = dict(self.data, position="$company Lead ($5M budget)")
+        paragraphs = self.render(data, "Applying for $position at $company")
+        self.assertEqual(paragraphs[0].text, "Applying for $company Lead ($5M budget) at Example Corp")
+
+    def test_bundled_template_layout(self):
+        """Test header, body, and signature paragraphs rendered from the bundled template."""
+        template = load_template(Path(__file__).parent.parent / "templates" / "cover_letter.txt")
+        data = dict(self.data, name="Daniel Kovach")  # Matches the template's signature
+        paragraphs = self.render(data, template)
+        texts = [para.text for para in paragraphs]
+
+        # Blank lines are dropped and surrounding whitespace stripped
+        self.assertTrue(all(text and text == text.strip() for text in texts))
+
+        # Header lines are tightly spaced
+        self.assertEqual(
+            texts[:4],
+            ["Daniel Kovach", "1 Main St, Springfield", "555-0100 | nicholas@example.com", "May 24, 2025"],
+        )
+        for para in paragraphs[:4]:
+            self.assertEqual(para.space_after, Pt(6))
+        self.assertEqual(texts[4], "Dear Hiring Manager,")
+        self.assertEqual(paragraphs[5].space_before, Pt(12))
+
+        # The name following "Sincerely," takes the signature branch, not the header branch
+        self.assertEqual(texts[-2:], ["Sincerely,", "Daniel Kovach"])
+        self.assertEqual(paragraphs[-2].space_before, Pt(12))
+        self.assertFalse(hasattr(paragraphs[-1], "space_after"))
+
+if __name__ == "__main__":
+    unittest.main()
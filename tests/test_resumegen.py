@@ -1,3 +1,4 @@
+import io
 import unittest
 from unittest.mock import patch, Mock, MagicMock
 from pathlib import Path
@@ -8,7 +9,7 @@ import requests
 from docx.text.paragraph import Paragraph
 from docx.oxml.ns import qn
 
-from resumegen import ResumeGen, load_json, fetch_json, logger
+from resumegen import ResumeConfig, ResumeGen, load_json, fetch_json, logger
 
 class TestResumeGen(unittest.TestCase):
     def setUp(self):
@@ -41,13 +42,42 @@ class TestResumeGen(unittest.TestCase):
         }
         self.test_file = Path("test_resume.json")
 
+    def test_config_from_dict(self):
+        """Test dictionary configs are converted to an immutable ResumeConfig."""
+        generator = ResumeGen(self.config)
+        self.assertEqual(
+            generator.config,
+            ResumeConfig(font_name="Arial", font_size=8, top=0.5, bottom=0.5, left=1.0, right=1.0),
+        )
+        with self.assertRaises(AttributeError):
+            generator.config.font_size = 10
+
+    def test_config_applied_to_document(self):
+        """Test ResumeConfig settings are applied to document styles and margins."""
+        config = ResumeConfig(font_name="Calibri", font_size=10, top=1.0, bottom=1.5, left=2.0, right=2.5)
+        generator = ResumeGen(config)
+        self.assertIs(generator.config, config)
+        self.assertEqual(generator.doc.styles["Normal"].font.name, "Calibri")
+        self.assertEqual(generator.doc.styles["Normal"].font.size, docx.shared.Pt(10))
+        section = generator.doc.sections[0]
+        self.assertAlmostEqual(section.top_margin.cm, 1.0, places=2)
+        self.assertAlmostEqual(section.right_margin.cm, 2.5, places=2)
+
     def test_load_json_success(self):
         """Test loading valid JSON from a file."""
         with patch("pathlib.Path.open", new_callable=MagicMock) as mock_open:
-            mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(self.resume_data)
+            mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(self.resume_data).encode()
+            result = load_json(self.test_file)
+            self.assertEqual(result, self.resume_data)
+            mock_open.assert_called_once_with("rb")
+
+    def test_load_json_without_orjson(self):
+        """Test loading JSON falls back to the stdlib decoder when orjson is unavailable."""
+        with patch("resumegen.orjson", None), \
+             patch("pathlib.Path.open", new_callable=MagicMock) as mock_open:
+            mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(self.resume_data).encode()
             result = load_json(self.test_file)
             self.assertEqual(result, self.resume_data)
-            mock_open.assert_called_once_with("r")
 
     def test_load_json_file_not_found(self):
         """Test loading JSON when file is not found."""
@@ -61,31 +91,45 @@ class TestResumeGen(unittest.TestCase):
         """Test loading invalid JSON."""
         with patch("pathlib.Path.open", new_callable=MagicMock) as mock_open, \
              self.assertLogs("resumegen", level="ERROR") as log:
-            mock_open.return_value.__enter__.return_value.read.return_value = "invalid json"
+            mock_open.return_value.__enter__.return_value.read.return_value = b"invalid json"
             with self.assertRaises(json.JSONDecodeError):
                 load_json(self.test_file)
             self.assertIn("Failed to load JSON from test_resume.json", log.output[0])
 
     def test_fetch_json_success(self):
         """Test fetching valid JSON from a URL."""
-        with patch("requests.get") as mock_get:
+        with patch("resumegen._SESSION.get") as mock_get:
             mock_response = Mock()
-            mock_response.json.return_value = self.resume_data
+            mock_response.content = json.dumps(self.resume_data).encode()
             mock_response.raise_for_status.return_value = None
             mock_get.return_value = mock_response
             result = fetch_json("https://example.com/resume.json", {"User-Agent": "test"})
             self.assertEqual(result, self.resume_data)
-            mock_get.assert_called_once_with("https://example.com/resume.json", headers={"User-Agent": "test"})
+            mock_get.assert_called_once_with(
+                "https://example.com/resume.json", headers={"User-Agent": "test"}, timeout=30
+            )
 
     def test_fetch_json_request_failure(self):
         """Test fetching JSON when the request fails."""
-        with patch("requests.get") as mock_get, \
+        with patch("resumegen._SESSION.get") as mock_get, \
              self.assertLogs("resumegen", level="ERROR") as log:
             mock_get.side_effect = requests.RequestException("Network error")
             with self.assertRaises(requests.RequestException):
                 fetch_json("https://example.com/resume.json", {"User-Agent": "test"})
             self.assertIn("Failed to fetch JSON from https://example.com/resume.json", log.output[0])
 
+    def test_fetch_json_invalid_json(self):
+        """Test fetching a response whose body is not valid JSON."""
+        with patch("resumegen._SESSION.get") as mock_get, \
+             self.assertLogs("resumegen", level="ERROR") as log:
+            mock_response = Mock()
+            mock_response.content = b"<html>oops"
+            mock_response.raise_for_status.return_value = None
+            mock_get.return_value = mock_response
+            with self.assertRaises(json.JSONDecodeError):
+                fetch_json("https://example.com/resume.json", {"User-Agent": "test"})
+            self.assertIn("Failed to fetch JSON from https://example.com/resume.json", log.output[0])
+
     def test_remove_hyperlink(self):
         """Test removing HTML <a> tags from text."""
         generator = ResumeGen(self.config)
@@ -118,18 +162,55 @@ class TestResumeGen(unittest.TestCase):
             )
             mock_oxml.assert_any_call("w:hyperlink")  # Check for w:hyperlink among calls
 
+    def test_add_hyperlink_reuses_relationship(self):
+        """Test repeated links to the same URL create a single relationship."""
+        generator = ResumeGen(self.config)
+        paragraph = generator.doc.add_paragraph()
+        with patch.object(paragraph.part, "relate_to", wraps=paragraph.part.relate_to) as mock_relate:
+            generator.add_hyperlink(paragraph, "First", "https://test.com")
+            generator.add_hyperlink(paragraph, "Second", "https://test.com")
+            mock_relate.assert_called_once()
+        r_ids = {h.get(qn("r:id")) for h in paragraph._p.iter(qn("w:hyperlink"))}
+        self.assertEqual(len(r_ids), 1)
+
+    def test_add_hyperlink_relationship_per_part(self):
+        """Test the same URL linked from different parts gets a relationship in each part."""
+        generator = ResumeGen(self.config)
+        body_paragraph = generator.doc.add_paragraph()
+        header_paragraph = generator.doc.sections[0].header.paragraphs[0]
+        self.assertIsNot(body_paragraph.part, header_paragraph.part)
+
+        generator.add_hyperlink(body_paragraph, "Body", "https://test.com")
+        generator.add_hyperlink(header_paragraph, "Header", "https://test.com")
+
+        for paragraph in (body_paragraph, header_paragraph):
+            r_id = next(paragraph._p.iter(qn("w:hyperlink"))).get(qn("r:id"))
+            self.assertEqual(paragraph.part.rels[r_id].target_ref, "https://test.com")
+
+    def test_process_text_without_hyperlinks(self):
+        """Test processing plain text adds a single run and no hyperlinks."""
+        generator = ResumeGen(self.config)
+        mock_paragraph = Mock(spec=Paragraph)
+        mock_paragraph.part = MagicMock()
+
+        generator.process_text_with_hyperlinks(mock_paragraph, "Plain bullet text.")
+        mock_paragraph.add_run.assert_called_once_with("Plain bullet text.")
+        mock_paragraph.part.relate_to.assert_not_called()
+
     def test_generate_resume_structure(self):
         """Test generating resume document structure."""
         generator = ResumeGen(self.config)
         # Mock Document methods without patching read-only attributes
         generator.doc = Mock()
         generator.doc.add_heading = Mock()
-        generator.doc.add_paragraph = Mock(return_value=Mock(spec=Paragraph))
-        generator.doc.add_paragraph.return_value.part = MagicMock()
-        generator.doc.add_paragraph.return_value.part.relate_to.return_value = "rId1"  # Return a string
         generator.doc.save = Mock()
+        mock_bullet = Mock(spec=Paragraph)
+        mock_bullet.part = MagicMock()
+        mock_bullet.part.relate_to.return_value = "rId1"  # Return a string
 
-        with patch("resumegen.logger") as mock_logger:
+        with patch("resumegen.logger") as mock_logger, \
+             patch("pathlib.Path.write_bytes") as mock_write_bytes, \
+             patch.object(generator, "_add_bullet_paragraph", return_value=mock_bullet) as mock_add_bullet:
             generator.generate_resume(self.resume_data, "output.docx")
 
             # Verify headings
@@ -139,11 +220,22 @@ class TestResumeGen(unittest.TestCase):
             generator.doc.add_heading.assert_any_call("Senior Software Engineer, Example - (2021-Present)", 2)
 
             # Verify paragraph for bullet point
-            generator.doc.add_paragraph.assert_called_once_with(style="List Bullet")
+            mock_add_bullet.assert_called_once_with()
 
             # Verify save
-            generator.doc.save.assert_called_once_with("output.docx")
-            mock_logger.info.assert_called_once_with("Resume saved to output.docx")
+            generator.doc.save.assert_called_once()
+            self.assertIsInstance(generator.doc.save.call_args[0][0], io.BytesIO)
+            mock_write_bytes.assert_called_once()
+            mock_logger.info.assert_called_once_with("Resume saved to %s", "output.docx")
+
+    def test_add_bullet_paragraph(self):
+        """Test bullet paragraphs use the List Bullet style and precede the section properties."""
+        generator = ResumeGen(self.config)
+        paragraph = generator._add_bullet_paragraph()
+        paragraph.add_run("Bullet text")
+        self.assertEqual(paragraph.style.name, "List Bullet")
+        self.assertEqual(generator.doc.paragraphs[-1].text, "Bullet text")
+        self.assertEqual(generator.doc.element.body[-1].tag, qn("w:sectPr"))
 
     def test_generate_resume_invalid_data(self):
         """Test generating resume with invalid data."""